@@ -44,8 +44,9 @@ ARSENAL_TEAM_ID = 359
 NBA_SCHEDULE_URL = "https://cdn.nba.com/static/json/staticData/scheduleLeagueV2_1.json"
 NBA_BOXSCORE_BASE_URL = "https://cdn.nba.com/static/json/liveData/boxscore/boxscore_{}.json"
 
-# ESPN API endpoint for Arsenal
-ESPN_ARSENAL_URL = f"https://site.api.espn.com/apis/site/v2/sports/soccer/eng.1/teams/{ARSENAL_TEAM_ID}"
+# ESPN API endpoints for Premier League teams
+ESPN_TEAM_URL = "https://site.api.espn.com/apis/site/v2/sports/soccer/eng.1/teams/{}"
+ESPN_ARSENAL_URL = ESPN_TEAM_URL.format(ARSENAL_TEAM_ID)
 
 # Team abbreviation to logo filename mapping - NBA
 TEAM_LOGO_MAP_NBA = {
@@ -117,45 +118,55 @@ def get_cache_filepath(endpoint):
     """Return the filepath for the cached data."""
     return os.path.join(CACHE_DIR, f"{endpoint}.json")
 
+def read_cache(endpoint, max_age=None):
+    """Return cached data for an endpoint, or None if missing, stale or unreadable.
+    
+    With no max_age, cached data of any age is returned.
+    """
+    cache_file = get_cache_filepath(endpoint)
+    if not os.path.exists(cache_file):
+        return None
+    
+    if max_age is not None and time.time() - os.path.getmtime(cache_file) >= max_age:
+        return None
+    
+    try:
+        with open(cache_file, 'r') as f:
+            return json.load(f)
+    except (json.JSONDecodeError, IOError) as e:
+        logger.warning(f"Cache read error: {e}")
+        return None
+
+def write_cache(endpoint, data):
+    """Save data to the cache file for an endpoint."""
+    with open(get_cache_filepath(endpoint), 'w') as f:
+        json.dump(data, f)
+
 def with_cache(endpoint, duration=CACHE_DURATION):
     """Decorator to cache function results to a JSON file."""
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            cache_file = get_cache_filepath(endpoint)
-            
             # Check if cache file exists and is fresh
-            if os.path.exists(cache_file):
-                file_modified_time = os.path.getmtime(cache_file)
-                if time.time() - file_modified_time < duration:
-                    try:
-                        with open(cache_file, 'r') as f:
-                            logger.info(f"Using cached data for {endpoint}")
-                            return json.load(f)
-                    except (json.JSONDecodeError, IOError) as e:
-                        logger.warning(f"Cache read error: {e}")
+            cached = read_cache(endpoint, duration)
+            if cached is not None:
+                logger.info(f"Using cached data for {endpoint}")
+                return cached
             
             # Get fresh data
             try:
                 logger.info(f"Fetching fresh data for {endpoint}")
                 result = func(*args, **kwargs)
-                
-                # Save to cache
-                with open(cache_file, 'w') as f:
-                    json.dump(result, f)
-                
+                write_cache(endpoint, result)
                 return result
             except Exception as e:
                 logger.error(f"Error fetching fresh data: {e}")
                 
                 # Try to use expired cache as fallback
-                if os.path.exists(cache_file):
-                    try:
-                        with open(cache_file, 'r') as f:
-                            logger.info(f"Using expired cache as fallback for {endpoint}")
-                            return json.load(f)
-                    except (json.JSONDecodeError, IOError) as e:
-                        logger.warning(f"Fallback cache read error: {e}")
+                cached = read_cache(endpoint)
+                if cached is not None:
+                    logger.info(f"Using expired cache as fallback for {endpoint}")
+                    return cached
                 
                 # Return error data structure as last resort
                 return {
@@ -173,203 +184,204 @@ def get_team_logo_filename(team_abbr, sport='nba'):
     else:  # premier league
         return TEAM_LOGO_MAP_PL.get(team_abbr.upper(), team_abbr.lower())
 
+# Headers sent with every upstream API request
+REQUEST_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept': 'application/json',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+}
+
 def make_request(url, timeout=10):
     """Make a request with proper headers."""
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-        'Accept': 'application/json',
-        'Accept-Language': 'en-US,en;q=0.9',
-        'Accept-Encoding': 'gzip, deflate, br',
-        'Connection': 'keep-alive',
-        'Upgrade-Insecure-Requests': '1',
-    }
-    
     try:
-        response = requests.get(url, headers=headers, timeout=timeout)
+        response = requests.get(url, headers=REQUEST_HEADERS, timeout=timeout)
         response.raise_for_status()
         return response.json()
     except requests.exceptions.RequestException as e:
         logger.error(f"Request failed for {url}: {e}")
         raise
 
-def get_rockets_schedule():
-    """Get Rockets games from NBA schedule API."""
-    try:
-        logger.info("Fetching NBA schedule data")
-        schedule_data = make_request(NBA_SCHEDULE_URL)
+def parse_rockets_schedule(schedule_data):
+    """Extract the window of Rockets games around today from NBA schedule data."""
+    rockets_games = []
+    now = datetime.datetime.now()
+    
+    # Look through the schedule for Rockets games
+    if 'leagueSchedule' in schedule_data and 'gameDates' in schedule_data['leagueSchedule']:
         
-        rockets_games = []
-        now = datetime.datetime.now()
+        # First pass: collect all Rockets games with dates
+        all_rockets_games = []
         
-        # Look through the schedule for Rockets games
-        if 'leagueSchedule' in schedule_data and 'gameDates' in schedule_data['leagueSchedule']:
-            
-            # First pass: collect all Rockets games with dates
-            all_rockets_games = []
-            
-            for game_date in schedule_data['leagueSchedule']['gameDates']:
-                if 'games' in game_date:
-                    for game in game_date['games']:
-                        # Check if Rockets are playing
-                        home_team_id = game.get('homeTeam', {}).get('teamId')
-                        away_team_id = game.get('awayTeam', {}).get('teamId')
+        for game_date in schedule_data['leagueSchedule']['gameDates']:
+            if 'games' in game_date:
+                for game in game_date['games']:
+                    # Check if Rockets are playing
+                    home_team_id = game.get('homeTeam', {}).get('teamId')
+                    away_team_id = game.get('awayTeam', {}).get('teamId')
+                    
+                    if home_team_id == ROCKETS_TEAM_ID or away_team_id == ROCKETS_TEAM_ID:
+                        # Parse game date to find position relative to today
+                        game_date_str = game.get('gameDateEst', '')
+                        game_time_str = game.get('gameTimeEst', '')
                         
-                        if home_team_id == ROCKETS_TEAM_ID or away_team_id == ROCKETS_TEAM_ID:
-                            # Parse game date to find position relative to today
-                            game_date_str = game.get('gameDateEst', '')
-                            game_time_str = game.get('gameTimeEst', '')
-                            
-                            try:
-                                # Handle ISO format with Z (UTC)
-                                if game_date_str.endswith('Z'):
-                                    game_datetime = datetime.datetime.fromisoformat(game_date_str[:-1])
-                                elif 'T' in game_date_str:
-                                    game_datetime = datetime.datetime.fromisoformat(game_date_str.replace('Z', ''))
+                        try:
+                            # Handle ISO format with Z (UTC)
+                            if game_date_str.endswith('Z'):
+                                game_datetime = datetime.datetime.fromisoformat(game_date_str[:-1])
+                            elif 'T' in game_date_str:
+                                game_datetime = datetime.datetime.fromisoformat(game_date_str.replace('Z', ''))
+                            else:
+                                if game_time_str:
+                                    game_datetime_str = f"{game_date_str} {game_time_str}"
+                                    game_datetime = datetime.datetime.strptime(game_datetime_str, "%Y-%m-%d %H:%M:%S")
                                 else:
-                                    if game_time_str:
-                                        game_datetime_str = f"{game_date_str} {game_time_str}"
-                                        game_datetime = datetime.datetime.strptime(game_datetime_str, "%Y-%m-%d %H:%M:%S")
-                                    else:
-                                        game_datetime = datetime.datetime.strptime(game_date_str, "%Y-%m-%d")
-                                
-                                all_rockets_games.append((game_datetime, game))
-                                
-                            except ValueError as e:
-                                logger.warning(f"Could not parse game date: {game_date_str} - {e}")
-                                continue
-            
-            # Sort all games by date
-            all_rockets_games.sort(key=lambda x: x[0])
-            
-            # Find today's position and create a window of 5 before + 5 after
-            today = now.date()
-            relevant_games = []
-            
-            # Find the index of the first game on or after today
-            future_game_index = None
-            for i, (game_datetime, game) in enumerate(all_rockets_games):
-                if game_datetime.date() >= today:
-                    future_game_index = i
-                    break
-            
-            if future_game_index is not None:
-                # Get 5 games before and 5 games after today
-                start_index = max(0, future_game_index - 5)
-                end_index = min(len(all_rockets_games), future_game_index + 5)
-                relevant_games = all_rockets_games[start_index:end_index]
-            else:
-                # All games are in the past, take the last 10
-                relevant_games = all_rockets_games[-10:] if len(all_rockets_games) >= 10 else all_rockets_games
-            
-            # Process the relevant games window
-            for game_datetime, game in relevant_games:
-                home_team_id = game.get('homeTeam', {}).get('teamId')
-                away_team_id = game.get('awayTeam', {}).get('teamId')
-                is_rockets_home = (home_team_id == ROCKETS_TEAM_ID)
-                
-                # Determine game status
-                game_status = game.get('gameStatus', 1)
-                game_status_text = game.get('gameStatusText', '')
-                
-                # Get team info
-                home_team = game.get('homeTeam', {})
-                away_team = game.get('awayTeam', {})
-                
-                home_team_abbr = home_team.get('teamTricode', 'HOU' if is_rockets_home else 'OPP')
-                away_team_abbr = away_team.get('teamTricode', 'OPP' if is_rockets_home else 'HOU')
-                
-                opponent_abbr = away_team_abbr if is_rockets_home else home_team_abbr
-                opponent_id = away_team.get('teamId', 0) if is_rockets_home else home_team.get('teamId', 0)
-                
-                # Get scores (will be 0 for future games)
-                home_score = home_team.get('score', 0)
-                away_score = away_team.get('score', 0)
-                
-                # Format scores for upcoming games
-                if game_status == 1:  # Scheduled
-                    home_score = "—"
-                    away_score = "—"
-                
-                game_info = {
-                    'game_id': game.get('gameId', ''),
-                    'game_date': game_datetime.isoformat(),
-                    'game_status': game_status,
-                    'game_status_text': game_status_text,
-                    'is_rockets_home': is_rockets_home,
-                    'home_team_id': ROCKETS_TEAM_ID if is_rockets_home else opponent_id,
-                    'home_team': 'HOU' if is_rockets_home else opponent_abbr,
-                    'home_team_city': 'Houston' if is_rockets_home else '',
-                    'home_team_score': home_score,
-                    'visitor_team_id': opponent_id if is_rockets_home else ROCKETS_TEAM_ID,
-                    'visitor_team': opponent_abbr if is_rockets_home else 'HOU',
-                    'visitor_team_city': '' if is_rockets_home else 'Houston',
-                    'visitor_team_score': away_score,
-                    'period': game.get('period', 0),
-                    'game_clock': game.get('gameClock', ''),
-                    'opponent': opponent_abbr,
-                    'opponent_id': opponent_id,
-                    'home_team_abbr': get_team_logo_filename(home_team_abbr),
-                    'visitor_team_abbr': get_team_logo_filename(away_team_abbr)
-                }
-                
-                rockets_games.append((game_datetime, game_info))
+                                    game_datetime = datetime.datetime.strptime(game_date_str, "%Y-%m-%d")
+                            
+                            all_rockets_games.append((game_datetime, game))
+                            
+                        except ValueError as e:
+                            logger.warning(f"Could not parse game date: {game_date_str} - {e}")
+                            continue
         
-        # Sort games by date
-        rockets_games.sort(key=lambda x: x[0])
+        # Sort all games by date
+        all_rockets_games.sort(key=lambda x: x[0])
         
-        return rockets_games
+        # Find today's position and create a window of 5 before + 5 after
+        today = now.date()
+        relevant_games = []
         
-    except Exception as e:
-        logger.error(f"Error fetching Rockets schedule: {e}")
-        logger.exception("Full traceback:")
-        return []
-
-def get_live_game_details(game_id):
-    """Get live game details from boxscore API."""
-    try:
-        boxscore_url = NBA_BOXSCORE_BASE_URL.format(game_id)
-        logger.info(f"Fetching live game data for {game_id}")
-        boxscore_data = make_request(boxscore_url)
+        # Find the index of the first game on or after today
+        future_game_index = None
+        for i, (game_datetime, game) in enumerate(all_rockets_games):
+            if game_datetime.date() >= today:
+                future_game_index = i
+                break
         
-        if 'game' in boxscore_data:
-            game = boxscore_data['game']
+        if future_game_index is not None:
+            # Get 5 games before and 5 games after today
+            start_index = max(0, future_game_index - 5)
+            end_index = min(len(all_rockets_games), future_game_index + 5)
+            relevant_games = all_rockets_games[start_index:end_index]
+        else:
+            # All games are in the past, take the last 10
+            relevant_games = all_rockets_games[-10:] if len(all_rockets_games) >= 10 else all_rockets_games
+        
+        # Process the relevant games window
+        for game_datetime, game in relevant_games:
+            home_team_id = game.get('homeTeam', {}).get('teamId')
+            away_team_id = game.get('awayTeam', {}).get('teamId')
+            is_rockets_home = (home_team_id == ROCKETS_TEAM_ID)
             
-            # Update game status and scores
+            # Determine game status
             game_status = game.get('gameStatus', 1)
             game_status_text = game.get('gameStatusText', '')
             
-            # Get current scores
+            # Get team info
             home_team = game.get('homeTeam', {})
             away_team = game.get('awayTeam', {})
             
+            home_team_abbr = home_team.get('teamTricode', 'HOU' if is_rockets_home else 'OPP')
+            away_team_abbr = away_team.get('teamTricode', 'OPP' if is_rockets_home else 'HOU')
+            
+            opponent_abbr = away_team_abbr if is_rockets_home else home_team_abbr
+            opponent_id = away_team.get('teamId', 0) if is_rockets_home else home_team.get('teamId', 0)
+            
+            # Get scores (will be 0 for future games)
             home_score = home_team.get('score', 0)
             away_score = away_team.get('score', 0)
             
-            # Get live game details
-            period = game.get('period', 0)
-            game_clock = game.get('gameClock', '')
+            # Format scores for upcoming games
+            if game_status == 1:  # Scheduled
+                home_score = "—"
+                away_score = "—"
             
-            return {
+            game_info = {
+                'game_id': game.get('gameId', ''),
+                'game_date': game_datetime.isoformat(),
                 'game_status': game_status,
                 'game_status_text': game_status_text,
+                'is_rockets_home': is_rockets_home,
+                'home_team_id': ROCKETS_TEAM_ID if is_rockets_home else opponent_id,
+                'home_team': 'HOU' if is_rockets_home else opponent_abbr,
+                'home_team_city': 'Houston' if is_rockets_home else '',
                 'home_team_score': home_score,
+                'visitor_team_id': opponent_id if is_rockets_home else ROCKETS_TEAM_ID,
+                'visitor_team': opponent_abbr if is_rockets_home else 'HOU',
+                'visitor_team_city': '' if is_rockets_home else 'Houston',
                 'visitor_team_score': away_score,
-                'period': period,
-                'game_clock': game_clock
+                'period': game.get('period', 0),
+                'game_clock': game.get('gameClock', ''),
+                'opponent': opponent_abbr,
+                'opponent_id': opponent_id,
+                'home_team_abbr': get_team_logo_filename(home_team_abbr),
+                'visitor_team_abbr': get_team_logo_filename(away_team_abbr)
             }
             
+            rockets_games.append((game_datetime, game_info))
+    
+    # Sort games by date
+    rockets_games.sort(key=lambda x: x[0])
+    
+    return rockets_games
+
+def get_rockets_schedule():
+    """Get Rockets games from NBA schedule API."""
+    try:
+        logger.info("Fetching NBA schedule data")
+        schedule_data = make_request(NBA_SCHEDULE_URL)
+        return parse_rockets_schedule(schedule_data)
+    except Exception as e:
+        logger.error(f"Error fetching Rockets schedule: {e}")
+        logger.exception("Full traceback:")
+        return []
+
+def parse_live_game_details(boxscore_data):
+    """Extract live status, scores and clock from boxscore data."""
+    if 'game' in boxscore_data:
+        game = boxscore_data['game']
+        
+        # Update game status and scores
+        game_status = game.get('gameStatus', 1)
+        game_status_text = game.get('gameStatusText', '')
+        
+        # Get current scores
+        home_team = game.get('homeTeam', {})
+        away_team = game.get('awayTeam', {})
+        
+        home_score = home_team.get('score', 0)
+        away_score = away_team.get('score', 0)
+        
+        # Get live game details
+        period = game.get('period', 0)
+        game_clock = game.get('gameClock', '')
+        
+        return {
+            'game_status': game_status,
+            'game_status_text': game_status_text,
+            'home_team_score': home_score,
+            'visitor_team_score': away_score,
+            'period': period,
+            'game_clock': game_clock
+        }
+    return None
+
+def get_live_game_details(game_id):
+    """Get live game details from boxscore API."""
+    try:
+        boxscore_url = NBA_BOXSCORE_BASE_URL.format(game_id)
+        logger.info(f"Fetching live game data for {game_id}")
+        boxscore_data = make_request(boxscore_url)
+        return parse_live_game_details(boxscore_data)
     except Exception as e:
         logger.error(f"Error fetching live game details for {game_id}: {e}")
         return None
 
-@with_cache("rockets_games", LIVE_GAME_CACHE_DURATION)
-def get_rockets_games():
-    """Get recent, current, and upcoming Rockets games using direct NBA APIs."""
+def build_rockets_games(all_games, live_details, now):
+    """Pick the Rockets games to display, applying live updates keyed by game ID."""
     rockets_games = []
-    now = datetime.datetime.now()
-    
-    # Get all Rockets games from schedule
-    all_games = get_rockets_schedule()
     
     if not all_games:
         return {
@@ -386,10 +398,10 @@ def get_rockets_games():
         game_status = game_info['game_status']
         
         if game_status == 2:  # Live/In Progress
-            # Get live updates for this game
-            live_details = get_live_game_details(game_info['game_id'])
-            if live_details:
-                game_info.update(live_details)
+            # Apply live updates for this game
+            game_details = live_details.get(game_info['game_id'])
+            if game_details:
+                game_info.update(game_details)
             live_games.append(game_info)
             
         elif game_status == 1 and game_datetime > now:  # Scheduled/Upcoming
@@ -442,144 +454,168 @@ def get_rockets_games():
         'games': rockets_games
     }
 
+@with_cache("rockets_games", LIVE_GAME_CACHE_DURATION)
+def get_rockets_games():
+    """Get recent, current, and upcoming Rockets games using direct NBA APIs."""
+    now = datetime.datetime.now()
+    
+    # Get all Rockets games from schedule
+    all_games = get_rockets_schedule()
+    
+    # Get live updates for games in progress
+    live_details = {
+        game_info['game_id']: get_live_game_details(game_info['game_id'])
+        for _, game_info in all_games
+        if game_info['game_status'] == 2
+    }
+    
+    return build_rockets_games(all_games, live_details, now)
+
+def parse_team_rank(data):
+    """Extract a team's league position/rank from ESPN team data."""
+    if 'team' in data and 'record' in data['team']:
+        team_record = data['team']['record'].get('items', [])
+        if team_record and len(team_record) > 0:
+            stats = team_record[0].get('stats', [])
+            if len(stats) > 23:
+                rank_stat = stats[23]
+                if rank_stat.get('name') == 'rank':
+                    return int(rank_stat.get('value', 0))
+    return None
+
 def fetch_team_rank(team_id):
     """Fetch a team's current league position/rank."""
     try:
-        url = f"https://site.api.espn.com/apis/site/v2/sports/soccer/eng.1/teams/{team_id}"
+        url = ESPN_TEAM_URL.format(team_id)
         logger.info(f"Fetching rank for team {team_id}")
         data = make_request(url)
-        
-        if 'team' in data and 'record' in data['team']:
-            team_record = data['team']['record'].get('items', [])
-            if team_record and len(team_record) > 0:
-                stats = team_record[0].get('stats', [])
-                if len(stats) > 23:
-                    rank_stat = stats[23]
-                    if rank_stat.get('name') == 'rank':
-                        return int(rank_stat.get('value', 0))
-        return None
+        return parse_team_rank(data)
     except Exception as e:
         logger.error(f"Error fetching team rank for {team_id}: {e}")
         return None
 
+def parse_arsenal_data(data):
+    """Extract the most relevant Arsenal game from ESPN team data.
+    
+    The opponent's position is left empty; fill it in with set_opponent_position.
+    """
+    # Extract the nextEvent array which contains current/upcoming/previous games
+    if 'team' in data and 'nextEvent' in data['team']:
+        next_events = data['team']['nextEvent']
+        
+        if next_events and len(next_events) > 0:
+            game = next_events[0]  # Get the most relevant game
+            
+            # Get competition details
+            if 'competitions' in game and len(game['competitions']) > 0:
+                competition = game['competitions'][0]
+                
+                # Get status information
+                status = competition.get('status', {})
+                status_state = status.get('type', {}).get('state', 'pre')
+                status_id = status.get('type', {}).get('id', 1)
+                status_desc = status.get('type', {}).get('description', '')
+                
+                # Get competitors (home is index 0, away is index 1)
+                competitors = competition.get('competitors', [])
+                if len(competitors) >= 2:
+                    home_team = competitors[0]
+                    away_team = competitors[1]
+                    
+                    # Determine if Arsenal is home or away
+                    is_arsenal_home = home_team.get('team', {}).get('id') == str(ARSENAL_TEAM_ID)
+                    
+                    # Get team information
+                    home_team_info = home_team.get('team', {})
+                    away_team_info = away_team.get('team', {})
+                    
+                    # Get scores
+                    home_score = home_team.get('score', {}).get('value', 0) if 'score' in home_team else None
+                    away_score = away_team.get('score', {}).get('value', 0) if 'score' in away_team else None
+                    
+                    # Get Arsenal's position from the main data
+                    arsenal_position = parse_team_rank(data)
+                    
+                    # Opponent rank needs its own request; see set_opponent_position
+                    opponent_position = None
+                    
+                    # For live games, try to get positions from the game data itself
+                    if status_state == 'in':
+                        # Sometimes live games include record data
+                        home_record = home_team.get('record', [])
+                        away_record = away_team.get('record', [])
+                        # You might need to parse these records if they exist
+                    
+                    # Assign positions based on who is home/away
+                    if is_arsenal_home:
+                        home_position = arsenal_position
+                        away_position = opponent_position
+                    else:
+                        home_position = opponent_position
+                        away_position = arsenal_position
+                    
+                    # Get clock/time information
+                    display_clock = status.get('displayClock', '')
+                    period = status.get('period', 0)
+                    
+                    # Format game data
+                    game_data = {
+                        'game_id': game.get('id', ''),
+                        'game_date': game.get('date', ''),
+                        'status_state': status_state,
+                        'status_id': status_id,
+                        'status_desc': status_desc,
+                        'is_arsenal_home': is_arsenal_home,
+                        'home_team': home_team_info.get('abbreviation', ''),
+                        'home_team_name': home_team_info.get('displayName', ''),
+                        'home_team_id': home_team_info.get('id', ''),
+                        'home_score': home_score,
+                        'home_position': home_position,
+                        'away_team': away_team_info.get('abbreviation', ''),
+                        'away_team_name': away_team_info.get('displayName', ''),
+                        'away_team_id': away_team_info.get('id', ''),
+                        'away_score': away_score,
+                        'away_position': away_position,
+                        'display_clock': display_clock,
+                        'period': period
+                    }
+                    
+                    return game_data
+                    
+    return None
+
+def get_opponent_team_id(game_data):
+    """Return the ESPN team ID of Arsenal's opponent."""
+    return game_data['away_team_id'] if game_data['is_arsenal_home'] else game_data['home_team_id']
+
+def set_opponent_position(game_data, position):
+    """Assign the opponent's league position based on who is home/away."""
+    if game_data['is_arsenal_home']:
+        game_data['away_position'] = position
+    else:
+        game_data['home_position'] = position
+
 def fetch_arsenal_data():
     """Fetch Arsenal data from ESPN API."""
     try:
         logger.info("Fetching Arsenal data from ESPN")
         data = make_request(ESPN_ARSENAL_URL)
+        game_data = parse_arsenal_data(data)
         
-        # Extract the nextEvent array which contains current/upcoming/previous games
-        if 'team' in data and 'nextEvent' in data['team']:
-            next_events = data['team']['nextEvent']
-            
-            if next_events and len(next_events) > 0:
-                game = next_events[0]  # Get the most relevant game
-                
-                # Get competition details
-                if 'competitions' in game and len(game['competitions']) > 0:
-                    competition = game['competitions'][0]
-                    
-                    # Get status information
-                    status = competition.get('status', {})
-                    status_state = status.get('type', {}).get('state', 'pre')
-                    status_id = status.get('type', {}).get('id', 1)
-                    status_desc = status.get('type', {}).get('description', '')
-                    
-                    # Get competitors (home is index 0, away is index 1)
-                    competitors = competition.get('competitors', [])
-                    if len(competitors) >= 2:
-                        home_team = competitors[0]
-                        away_team = competitors[1]
-                        
-                        # Determine if Arsenal is home or away
-                        is_arsenal_home = home_team.get('team', {}).get('id') == str(ARSENAL_TEAM_ID)
-                        
-                        # Get team information
-                        home_team_info = home_team.get('team', {})
-                        away_team_info = away_team.get('team', {})
-                        
-                        # Get scores
-                        home_score = home_team.get('score', {}).get('value', 0) if 'score' in home_team else None
-                        away_score = away_team.get('score', {}).get('value', 0) if 'score' in away_team else None
-                        
-                        # Get Arsenal's position from the main data
-                        arsenal_position = None
-                        if 'team' in data and 'record' in data['team']:
-                            team_record = data['team']['record'].get('items', [])
-                            if team_record and len(team_record) > 0:
-                                stats = team_record[0].get('stats', [])
-                                if len(stats) > 23:
-                                    rank_stat = stats[23]
-                                    if rank_stat.get('name') == 'rank':
-                                        arsenal_position = int(rank_stat.get('value', 0))
-                        
-                        # Get opponent's ID from competitors and fetch their rank
-                        opponent_competitor_id = away_team.get('id') if is_arsenal_home else home_team.get('id')
-                        opponent_team_id = away_team_info.get('id') if is_arsenal_home else home_team_info.get('id')
-                        opponent_position = None
-                        
-                        # Use competitor ID for fetching rank
-			# Fetch opponent rank for all game states
-                        if opponent_team_id:
-                            opponent_position = fetch_team_rank(opponent_team_id)
-                        
-                        # For live games, try to get positions from the game data itself
-                        if status_state == 'in':
-                            # Sometimes live games include record data
-                            home_record = home_team.get('record', [])
-                            away_record = away_team.get('record', [])
-                            # You might need to parse these records if they exist
-                        
-                        # Assign positions based on who is home/away
-                        if is_arsenal_home:
-                            home_position = arsenal_position
-                            away_position = opponent_position
-                        else:
-                            home_position = opponent_position
-                            away_position = arsenal_position
-                        
-                        # Get clock/time information
-                        display_clock = status.get('displayClock', '')
-                        period = status.get('period', 0)
-                        
-                        # Format game data
-                        game_data = {
-                            'game_id': game.get('id', ''),
-                            'game_date': game.get('date', ''),
-                            'status_state': status_state,
-                            'status_id': status_id,
-                            'status_desc': status_desc,
-                            'is_arsenal_home': is_arsenal_home,
-                            'home_team': home_team_info.get('abbreviation', ''),
-                            'home_team_name': home_team_info.get('displayName', ''),
-                            'home_team_id': home_team_info.get('id', ''),
-                            'home_score': home_score,
-                            'home_position': home_position,
-                            'away_team': away_team_info.get('abbreviation', ''),
-                            'away_team_name': away_team_info.get('displayName', ''),
-                            'away_team_id': away_team_info.get('id', ''),
-                            'away_score': away_score,
-                            'away_position': away_position,
-                            'display_clock': display_clock,
-                            'period': period
-                        }
-                        
-                        return game_data
-                        
-        return None
+        # Fetch opponent rank for all game states
+        if game_data:
+            opponent_team_id = get_opponent_team_id(game_data)
+            if opponent_team_id:
+                set_opponent_position(game_data, fetch_team_rank(opponent_team_id))
         
+        return game_data
     except Exception as e:
         logger.error(f"Error fetching Arsenal data: {e}")
         logger.exception("Full traceback:")
         return None
 
-@with_cache("arsenal_games", LIVE_GAME_CACHE_DURATION_PL)
-def get_arsenal_games():
-    """Get Arsenal game data."""
-    now = datetime.datetime.now()
-    
-    game_data = fetch_arsenal_data()
-    
+def build_arsenal_games(game_data, now):
+    """Wrap Arsenal game data for frontend consumption."""
     if not game_data:
         return {
             'update_time': now.isoformat(),
@@ -606,6 +642,15 @@ def get_arsenal_games():
         'cache_duration': cache_duration
     }
 
+@with_cache("arsenal_games", LIVE_GAME_CACHE_DURATION_PL)
+def get_arsenal_games():
+    """Get Arsenal game data."""
+    now = datetime.datetime.now()
+    
+    game_data = fetch_arsenal_data()
+    
+    return build_arsenal_games(game_data, now)
+
 # API routes
 @app.route('/api/rockets/games', methods=['GET'])
 def rockets_games():
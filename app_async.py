@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""Asyncio serving mode for the startpage API.
+
+Serves the same routes as app.py on an aiohttp server, with upstream API calls
+made as non-blocking coroutines over one shared client session. Idle or slow
+connections cost a coroutine instead of a thread, so a single process can hold
+many open kiosks and tabs.
+"""
+import asyncio
+import datetime
+import os
+from functools import wraps
+
+import aiohttp
+from aiohttp import web
+
+from app import (
+    CACHE_DURATION,
+    ESPN_ARSENAL_URL,
+    ESPN_TEAM_URL,
+    LIVE_GAME_CACHE_DURATION,
+    LIVE_GAME_CACHE_DURATION_PL,
+    NBA_BOXSCORE_BASE_URL,
+    NBA_SCHEDULE_URL,
+    REQUEST_HEADERS,
+    STATIC_FOLDER,
+    build_arsenal_games,
+    build_rockets_games,
+    get_cache_filepath,
+    get_opponent_team_id,
+    logger,
+    parse_arsenal_data,
+    parse_live_game_details,
+    parse_rockets_schedule,
+    parse_team_rank,
+    read_cache,
+    set_opponent_position,
+    write_cache,
+)
+
+# Upstream connection pool limits
+UPSTREAM_CONNECTION_LIMIT = 20
+UPSTREAM_CONNECTION_LIMIT_PER_HOST = 5
+
+# Shared upstream client session, opened on server startup
+http_session = None
+
+def with_async_cache(endpoint, duration=CACHE_DURATION):
+    """Decorator to cache coroutine results to a JSON file.
+
+    Only one refresh per endpoint runs at a time; concurrent requests wait for
+    it and then read the fresh cache instead of hitting upstream themselves.
+    """
+    def decorator(func):
+        lock = asyncio.Lock()
+
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            # Check if cache file exists and is fresh
+            cached = read_cache(endpoint, duration)
+            if cached is not None:
+                logger.info(f"Using cached data for {endpoint}")
+                return cached
+
+            async with lock:
+                # Another request may have refreshed the cache while we waited
+                cached = read_cache(endpoint, duration)
+                if cached is not None:
+                    logger.info(f"Using cached data for {endpoint}")
+                    return cached
+
+                # Get fresh data
+                try:
+                    logger.info(f"Fetching fresh data for {endpoint}")
+                    result = await func(*args, **kwargs)
+                    write_cache(endpoint, result)
+                    return result
+                except Exception as e:
+                    logger.error(f"Error fetching fresh data: {e}")
+
+                    # Try to use expired cache as fallback
+                    cached = read_cache(endpoint)
+                    if cached is not None:
+                        logger.info(f"Using expired cache as fallback for {endpoint}")
+                        return cached
+
+                    # Return error data structure as last resort
+                    return {
+                        "error": True,
+                        "message": str(e)
+                    }
+
+        return wrapper
+    return decorator
+
+async def make_request(url, timeout=10):
+    """Make a non-blocking request with proper headers."""
+    try:
+        async with http_session.get(url, headers=REQUEST_HEADERS,
+                                    timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+            response.raise_for_status()
+            return await response.json(content_type=None)
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        logger.error(f"Request failed for {url}: {e}")
+        raise
+
+async def get_rockets_schedule():
+    """Get Rockets games from NBA schedule API."""
+    try:
+        logger.info("Fetching NBA schedule data")
+        schedule_data = await make_request(NBA_SCHEDULE_URL)
+        return parse_rockets_schedule(schedule_data)
+    except Exception as e:
+        logger.error(f"Error fetching Rockets schedule: {e}")
+        logger.exception("Full traceback:")
+        return []
+
+async def get_live_game_details(game_id):
+    """Get live game details from boxscore API."""
+    try:
+        boxscore_url = NBA_BOXSCORE_BASE_URL.format(game_id)
+        logger.info(f"Fetching live game data for {game_id}")
+        boxscore_data = await make_request(boxscore_url)
+        return parse_live_game_details(boxscore_data)
+    except Exception as e:
+        logger.error(f"Error fetching live game details for {game_id}: {e}")
+        return None
+
+@with_async_cache("rockets_games", LIVE_GAME_CACHE_DURATION)
+async def get_rockets_games():
+    """Get recent, current, and upcoming Rockets games using direct NBA APIs."""
+    now = datetime.datetime.now()
+
+    # Get all Rockets games from schedule
+    all_games = await get_rockets_schedule()
+
+    # Get live updates for games in progress concurrently
+    live_game_ids = [game_info['game_id'] for _, game_info in all_games
+                     if game_info['game_status'] == 2]
+    details = await asyncio.gather(*(get_live_game_details(game_id) for game_id in live_game_ids))
+    live_details = dict(zip(live_game_ids, details))
+
+    return build_rockets_games(all_games, live_details, now)
+
+async def fetch_team_rank(team_id):
+    """Fetch a team's current league position/rank."""
+    try:
+        url = ESPN_TEAM_URL.format(team_id)
+        logger.info(f"Fetching rank for team {team_id}")
+        data = await make_request(url)
+        return parse_team_rank(data)
+    except Exception as e:
+        logger.error(f"Error fetching team rank for {team_id}: {e}")
+        return None
+
+async def fetch_arsenal_data():
+    """Fetch Arsenal data from ESPN API."""
+    try:
+        logger.info("Fetching Arsenal data from ESPN")
+        data = await make_request(ESPN_ARSENAL_URL)
+        game_data = parse_arsenal_data(data)
+
+        # Fetch opponent rank for all game states
+        if game_data:
+            opponent_team_id = get_opponent_team_id(game_data)
+            if opponent_team_id:
+                set_opponent_position(game_data, await fetch_team_rank(opponent_team_id))
+
+        return game_data
+    except Exception as e:
+        logger.error(f"Error fetching Arsenal data: {e}")
+        logger.exception("Full traceback:")
+        return None
+
+@with_async_cache("arsenal_games", LIVE_GAME_CACHE_DURATION_PL)
+async def get_arsenal_games():
+    """Get Arsenal game data."""
+    now = datetime.datetime.now()
+
+    game_data = await fetch_arsenal_data()
+
+    return build_arsenal_games(game_data, now)
+
+def remove_cache(endpoint):
+    """Delete the cache file for an endpoint, if present."""
+    cache_file = get_cache_filepath(endpoint)
+    if os.path.exists(cache_file):
+        os.remove(cache_file)
+
+# API routes
+routes = web.RouteTableDef()
+
+@routes.get('/api/rockets/games')
+async def rockets_games(request):
+    """API endpoint to get Rockets games data."""
+    return web.json_response(await get_rockets_games())
+
+@routes.get('/api/rockets/games/refresh')
+async def refresh_rockets_games(request):
+    """Force refresh the rockets games data."""
+    remove_cache("rockets_games")
+    return web.json_response(await get_rockets_games())
+
+@routes.get('/api/arsenal/games')
+async def arsenal_games(request):
+    """API endpoint to get Arsenal games data."""
+    return web.json_response(await get_arsenal_games())
+
+@routes.get('/api/arsenal/games/refresh')
+async def refresh_arsenal_games(request):
+    """Force refresh the arsenal games data."""
+    remove_cache("arsenal_games")
+    return web.json_response(await get_arsenal_games())
+
+@routes.get('/api/health')
+async def health_check(request):
+    """Health check endpoint."""
+    return web.json_response({"status": "ok", "timestamp": datetime.datetime.now().isoformat()})
+
+# Static file routes
+@routes.get('/')
+async def serve_index(request):
+    return web.FileResponse(os.path.join(STATIC_FOLDER, 'index.html'))
+
+@routes.get('/{path:.+}')
+async def serve_static(request):
+    """Serve static files."""
+    static_root = os.path.realpath(STATIC_FOLDER)
+    file_path = os.path.realpath(os.path.join(static_root, request.match_info['path']))
+
+    # Refuse paths that escape the static folder
+    if not file_path.startswith(static_root + os.sep) or not os.path.isfile(file_path):
+        raise web.HTTPNotFound()
+    return web.FileResponse(file_path)
+
+# Add CORS and caching headers to all responses
+@web.middleware
+async def add_header(request, handler):
+    response = await handler(request)
+    response.headers['Access-Control-Allow-Origin'] = '*'
+    if 'Cache-Control' not in response.headers:
+        response.headers['Cache-Control'] = 'public, max-age=86400'  # Cache for 1 day
+    return response
+
+async def client_session_ctx(app):
+    """Open the shared upstream client session for the server's lifetime."""
+    global http_session
+    connector = aiohttp.TCPConnector(limit=UPSTREAM_CONNECTION_LIMIT,
+                                     limit_per_host=UPSTREAM_CONNECTION_LIMIT_PER_HOST)
+    http_session = aiohttp.ClientSession(connector=connector)
+    yield
+    await http_session.close()
+
+def create_app():
+    """Create the aiohttp application."""
+    app = web.Application(middlewares=[add_header])
+    app.cleanup_ctx.append(client_session_ctx)
+    app.add_routes(routes)
+    return app
+
+if __name__ == '__main__':
+    web.run_app(
+        create_app(),
+        host='0.0.0.0',
+        port=8080
+    )